@@ -50,6 +50,10 @@ class SqlBlockParser(SimpleSQLParser[SqlNode]):
 
 class SqlMacroParser(MacroParser):
     def parse_remote(self, contents) -> Iterable[Macro]:
+        # most remote requests carry no macros, skip building and lexing
+        # an empty macro file for them
+        if not contents:
+            return
         base = UnparsedMacro(
             path="from remote system",
             original_file_path="from remote system",
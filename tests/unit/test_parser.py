@@ -52,6 +52,7 @@ from dbt.parser.schemas import (
 )
 from dbt.parser.search import FileBlock
 from dbt.parser.sources import SourcePatcher
+from dbt.parser.sql import SqlMacroParser
 from .utils import config_from_parts_or_dicts, normalize, generate_name_macros, MockNode
 from dbt.flags import set_from_args
 from argparse import Namespace
@@ -1564,6 +1565,25 @@ class MacroParserTest(BaseParserTest):
         )
 
 
+class SqlMacroParserTest(BaseParserTest):
+    def setUp(self):
+        super().setUp()
+        self.parser = SqlMacroParser(project=self.snowplow_project_config, manifest=Manifest())
+
+    def test_parse_remote(self):
+        raw_code = "{% macro foo(a, b) %}a ~ b{% endmacro %}"
+        macros = list(self.parser.parse_remote(raw_code))
+        self.assertEqual(len(macros), 1)
+        self.assertEqual(macros[0].unique_id, "macro.snowplow.foo")
+        self.assertEqual(macros[0].macro_sql, raw_code)
+
+    def test_parse_remote_empty(self):
+        with mock.patch.object(self.parser, "parse_unparsed_macros") as parse_unparsed_macros:
+            self.assertEqual(list(self.parser.parse_remote("")), [])
+            self.assertEqual(list(self.parser.parse_remote(None)), [])
+        parse_unparsed_macros.assert_not_called()
+
+
 class SingularTestParserTest(BaseParserTest):
     def setUp(self):
         super().setUp()